@@ -1,5 +1,7 @@
 """Module for decorators."""
 
+import functools
+
 from models import ContactError
 
 def input_error(strerror: str = "Invalid input."):
@@ -10,9 +12,12 @@ def input_error(strerror: str = "Invalid input."):
         Can be overridden by passing a custom message to the decorator.
     """
     def decorator(func):
-        def wrapper(*args, **kwargs):
+        # Every handler takes exactly (args, book), so the wrapper mirrors
+        # that signature instead of unpacking *args/**kwargs on each call.
+        @functools.wraps(func)
+        def wrapper(args, book):
             try:
-                return func(*args, **kwargs)
+                return func(args, book)
             except(ValueError, IndexError, ContactError) as e:
                 if hasattr(e, "message"):
                     return f"{strerror}\nError: {e.message}"
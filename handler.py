@@ -1,6 +1,5 @@
 """Module for handling commands."""
 
-from datetime import datetime
 from decorators import input_error
 from models import AddressBook, Record
 
@@ -44,7 +43,7 @@ def get_contact(args, book: AddressBook) -> Record:
 
 def get_all_contacts(args, book: AddressBook) -> list:
     """Gets all contacts."""
-    return [str(record) for record in book.data.values()]
+    return [str(record) for record in book.values()]
 
 @input_error(strerror="Invalid command. Usage: add-birthday [ім'я] [дата народження]")
 def add_birthday(args, book: AddressBook) -> str:
@@ -61,7 +60,7 @@ def show_birthday(args, book: AddressBook) -> str:
     record = book.find(name, raise_error=True)
     if record.birthday is None:
         return "Birthday not set."
-    return datetime.strftime(record.birthday.value, "%d.%m.%Y")
+    return record.birthday.value.strftime("%d.%m.%Y")
 
 @input_error(strerror="Invalid command. Usage: birthdays")
 def birthdays(args, book: AddressBook) -> str:
@@ -69,4 +68,5 @@ def birthdays(args, book: AddressBook) -> str:
     bdays = book.get_upcoming_birthdays()
     if len(bdays) == 0:
         return "No upcoming birthdays."
-    return "Upcomming birthdays:\n".join([f"{item["name"]}: {item["congratulation_date"]}" for item in bdays])
+    items = (f"{item['name']}: {item['congratulation_date']}" for item in bdays)
+    return "Upcoming birthdays:\n" + "\n".join(items)
@@ -4,10 +4,27 @@ import handler
 
 from models import AddressBook
 
+COMMANDS = {
+    "all": handler.get_all_contacts,
+    "add": handler.add_contact,
+    "change": handler.change_contact,
+    "contact": handler.get_contact,
+    "delete": handler.delete_contact,
+    "add-birthday": handler.add_birthday,
+    "show-birthday": handler.show_birthday,
+    "birthdays": handler.birthdays,
+}
+
+USAGE = "Invalid command. Usage: hello | all | add [name] [phone] | "\
+        "change [name] [phone] | contact [name] | delete [name] | "\
+        "add-birthday [name] [date] | show-birthday [name] | birthdays | "\
+        "exit | close"
+
 def parse_input(user_input: str) -> tuple:
     """Parses user input and returns command and arguments."""
-    cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
+    head, _, rest = user_input.strip().partition(" ")
+    cmd = head.lower()
+    args = rest.split() if rest else []
     return cmd, *args
 
 def main():
@@ -26,36 +43,14 @@ def main():
 
         if command == "hello":
             print("How can I help you?")
+            continue
 
-        elif command == "all":
-            print(handler.get_all_contacts(args, book))
-
-        elif command == "add":
-            print(handler.add_contact(args, book))
-
-        elif command == "change":
-            print(handler.change_contact(args, book))
-
-        elif command == "contact":
-            print(handler.get_contact(args, book))
-
-        elif command == "delete":
-            print(handler.delete_contact(args, book))
-
-        elif command == "add-birthday":
-            print(handler.add_birthday(args, book))
-
-        elif command == "show-birthday":
-            print(handler.show_birthday(args, book))
-
-        elif command == "birthdays":
-            print(handler.birthdays(args, book))
+        command_handler = COMMANDS.get(command)
+        if command_handler is None:
+            print(USAGE)
+            continue
 
-        else:
-            print("Invalid command. Usage: hello | all | add [name] [phone] | "\
-                  "change [name] [phone] | contact [name] | delete [name] | "\
-                  "add-birthday [name] [date] | show-birthday [name] | birthdays | "\
-                  "exit | close")
+        print(command_handler(args, book))
 
 if __name__ == "__main__":
     main()
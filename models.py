@@ -1,14 +1,18 @@
 """Module that contains classes for working with address book."""
 
-import re
 import datetime
 
-from collections import UserDict
+# Deletion table that strips every ASCII character except digits and '+'.
+_KEEP = str.maketrans("", "", "".join(
+    chr(c) for c in range(256) if not (chr(c).isdigit() or chr(c) == "+")
+))
 
 class Field:
     """
     Represents a base field object.
     """
+    __slots__ = ("value",)
+
     def __init__(self, value: any) -> None:
         self.value = value
 
@@ -28,9 +32,18 @@ class Name(Field):
     """
     Represents a name field.
     """
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
         super().__init__(value)
 
+    def __eq__(self, other) -> bool:
+        # type() is a C-level slot read, cheaper than isinstance over the MRO.
+        return type(other) is Name and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
 
 class Phone(Field):
     """
@@ -45,19 +58,45 @@ class Phone(Field):
     Raises:
         ValueError: If the phone number format is not valid.
     """
-    pattern = r"[+\d]"
+    __slots__ = ("_hash",)
+
     country_code = "38"
 
     def __init__(self, value: str) -> None:
-        phone = "".join(re.findall(self.pattern, value))
+        phone = self._normalize(value)
+        super().__init__(phone)
+        self._hash = hash(phone)
+
+    @classmethod
+    def _normalize(cls, value: str) -> str:
+        """
+        Returns the canonical +38XXXXXXXXXX form of a phone string.
+
+        Raises:
+            ValueError: If the phone number format is not valid.
+        """
+        # Fast path: already-canonical input needs no stripping at all.
+        if len(value) == 13 and value[0] == "+" and value[1:].isdigit():
+            return value
+
+        phone = value.translate(_KEEP)
 
         if not phone.startswith("+"):
-            phone = re.sub(fr"^({self.country_code})?", f"+{self.country_code}", phone)
+            if phone.startswith(cls.country_code):
+                phone = phone[len(cls.country_code):]
+            phone = f"+{cls.country_code}{phone}"
 
         if len(phone) != 13:
             raise ValueError("Invalid phone number. Use (+38) XXX-XXX-XX-XX format.")
 
-        super().__init__(phone)
+        return phone
+
+    def __eq__(self, other) -> bool:
+        return type(other) is Phone and self._hash == other._hash \
+            and self.value == other.value
+
+    def __hash__(self):
+        return self._hash
 
 class Birthday(Field):
     """
@@ -66,13 +105,18 @@ class Birthday(Field):
      Raises:
         ValueError: If the bitrhday format is not valid.
     """
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
-        bday = None
+        # The format is fixed-width "DD.MM.YYYY", so slice the digits out
+        # directly instead of walking strptime's format interpreter.
+        if len(value) != 10 or value[2] != "." or value[5] != ".":
+            raise ValueError("Invalid date format. Use DD.MM.YYYY")
         try:
-            bday = datetime.datetime.strptime(value, "%d.%m.%Y")
+            bday = datetime.date(int(value[6:10]), int(value[3:5]), int(value[0:2]))
         except ValueError as e:
             raise ValueError("Invalid date format. Use DD.MM.YYYY") from e
-        if bday > datetime.datetime.now():
+        if bday > datetime.date.today():
             raise ValueError("Birthday can't be in the future.")
         if bday.year < 1900:
             raise ValueError("Birthday can't be earlier than 1900.")
@@ -87,66 +131,72 @@ class Record:
 
     Attributes:
         name (Name): The name of the contact.
-        phones (list): A list of phone numbers associated with the contact.
+        phones (dict): Phone numbers associated with the contact, keyed by normalized value.
         birthday (Birthday): Optional birthday of the contact.
     """
 
     def __init__(self, name: str):
         self.name = Name(name)
-        self.phones = []
+        self.phones = {}
         self.birthday = None
+        self._book = None
+        self._str_cache = None
 
     def add_phone(self, phone: str):
         """
-        Adds a phone number to the contact's list of phone numbers.
+        Adds a phone number to the contact's phone numbers.
 
         Args:
             phone (Phone): The phone number to add.
 
         Raises:
-            ContactError: If the phone number already exists in the contact's list of phone numbers.
+            ContactError: If the phone number already exists in the contact's phone numbers.
         """
-        if self.find_phone(phone):
+        new_phone = Phone(phone)
+        if new_phone.value in self.phones:
             raise ContactError("Phone number already exists.")
 
-        self.phones.append(Phone(phone))
+        self.phones[new_phone.value] = new_phone
+        self._str_cache = None
 
     def remove_phone(self, phone: str):
         """
-        Removes a phone number from the contact's list of phone numbers.
+        Removes a phone number from the contact's phone numbers.
         Won't raise error if phone number not exist.
 
         Args:
             phone (str): The phone number to remove.
         """
-        existing_phone = self.find_phone(phone)
-        if existing_phone:
-            self.phones.remove(existing_phone)
+        self.phones.pop(Phone._normalize(phone), None)
+        self._str_cache = None
 
     def edit_phone(self, phone: str, new_phone: str):
         """
-        Edits a phone number in the contact's list of phone numbers.
+        Edits a phone number in the contact's phone numbers.
 
         Args:
             phone (str): The phone number to edit.
             new_phone (str): The new phone number.
 
         Raises:
-            ContactError: If the phone number to edit does not exist in the contact's phones list,
-                        or if the new phone number already exists in the contact's phones list.
+            ContactError: If the phone number to edit does not exist in the contact's phones,
+                        or if the new phone number already exists in the contact's phones.
         """
         existing_phone = self.find_phone(phone)
         if not existing_phone:
             raise ContactError("No such phone number.")
 
-        if self.find_phone(new_phone):
+        replacement = Phone(new_phone)
+        if replacement.value in self.phones:
             raise ContactError("New phone number already exists.")
 
-        self.phones[self.phones.index(existing_phone)] = Phone(new_phone)
+        del self.phones[existing_phone.value]
+        self.phones[replacement.value] = replacement
+        self._str_cache = None
 
     def find_phone(self, phone: str) -> Phone | None:
         """
-        Finds a phone number in the contact's list of phone numbers.
+        Finds a phone number in the contact's phone numbers.
 
         Args:
             phone (str): The phone number to check.
@@ -154,31 +204,35 @@ class Record:
         Returns:
             Phone: The phone number if found, None otherwise.
         """
-        target_phone = Phone(phone)
-        return next((p for p in self.phones if p == target_phone), None)
+        return self.phones.get(Phone._normalize(phone))
 
     def add_birthday(self, birthday: str):
         """
         Adds or overrides a birthday of the contact.
         """
-        self.birthday = Birthday(birthday)
+        new_birthday = Birthday(birthday)
+
+        if self._book is not None and self.birthday is not None:
+            self._book._unindex_birthday(self)
+
+        self.birthday = new_birthday
+        self._str_cache = None
+
+        if self._book is not None:
+            self._book._index_birthday(self)
 
     def __str__(self):
-        chunks = []
-        chunks.append(f"Contact name: {self.name}")
-        chunks.append(f"phones: {'; '.join(p.value for p in self.phones)}")
-        if self.birthday:
-            chunks.append(f"birthday: {self.birthday.value.strftime('%d.%m.%Y')}")
-        return ", ".join(chunks)
-
-class AddressBook(UserDict):
+        if self._str_cache is None:
+            phones = "; ".join(self.phones)
+            birthday = f", birthday: {self.birthday.value:%d.%m.%Y}" if self.birthday else ""
+            self._str_cache = f"Contact name: {self.name}, phones: {phones}{birthday}"
+        return self._str_cache
+
+class AddressBook(dict):
     """
     A class representing an address book.
 
-    This class extends the UserDict class to provide functionality for managing contacts in an address book.
-
-    Attributes:
-        data (dict): A dictionary to store the contacts in the address book.
+    This class extends the built-in dict to provide functionality for managing contacts in an address book.
 
     Methods:
         add_record(record: Record): Adds a record to the address book.
@@ -186,6 +240,50 @@ class AddressBook(UserDict):
         delete(name: Name): Deletes a record from the address book by name.
     """
 
+    def __init__(self, *args, **kwargs):
+        self._by_mmdd = {}
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def from_records(cls, rows) -> "AddressBook":
+        """
+        Builds an address book from an iterable of (name, phone, birthday) rows,
+        e.g. loaded from CSV/JSON storage.
+
+        Empty phone or birthday values are skipped. Rows sharing a name add
+        phones to the same record. Phones already in canonical +38XXXXXXXXXX
+        form bypass normalization via the Phone fast path.
+
+        Raises:
+            ContactError: If a row repeats an existing phone number.
+            ValueError: If a phone or birthday value is not valid.
+        """
+        book = cls()
+        for name, phone, birthday in rows:
+            record = book.get(name)
+            if record is None:
+                record = Record(name)
+                book.add_record(record)
+            if phone:
+                record.add_phone(phone)
+            if birthday:
+                record.add_birthday(birthday)
+        return book
+
+    def _index_birthday(self, record: Record) -> None:
+        """Registers a record under its (month, day) birthday key."""
+        bday = record.birthday.value
+        self._by_mmdd.setdefault((bday.month, bday.day), []).append(record)
+
+    def _unindex_birthday(self, record: Record) -> None:
+        """Removes a record from its (month, day) birthday key."""
+        bday = record.birthday.value
+        records = self._by_mmdd.get((bday.month, bday.day))
+        if records and record in records:
+            records.remove(record)
+            if not records:
+                del self._by_mmdd[(bday.month, bday.day)]
+
     def add_record(self, record: Record) -> None:
         """
         Adds a record to the data dictionary.
@@ -196,10 +294,13 @@ class AddressBook(UserDict):
         Raises:
             ContactError: If the contact already exists in the data dictionary.
         """
-        if record.name in self.data:
+        if record.name.value in self:
             raise ContactError("Contact already exists.")
 
-        self.data[record.name] = record
+        self[record.name.value] = record
+        record._book = self
+        if record.birthday is not None:
+            self._index_birthday(record)
 
     def find(self, name: str, raise_error: bool = True) -> Record | None:
         """
@@ -216,14 +317,12 @@ class AddressBook(UserDict):
         Raises:
             ContactError: If no contact with the given name is found. Only if raise_error is True.
         """
-        name = Name(name)
-
-        if name not in self.data:
+        if name not in self:
             if raise_error:
                 raise ContactError("No such contact.")
             return None
 
-        return self.data[name]
+        return self[name]
 
     def delete(self, name: str):
         """
@@ -233,10 +332,11 @@ class AddressBook(UserDict):
         Args:
             name (str): The name to be deleted.
         """
-        name = Name(name)
-
-        if name in self.data:
-            del self.data[name]
+        if name in self:
+            record = self.pop(name)
+            record._book = None
+            if record.birthday is not None:
+                self._unindex_birthday(record)
 
     def get_upcoming_birthdays(self):
         """
@@ -246,24 +346,21 @@ class AddressBook(UserDict):
         today = datetime.date.today()
         upcoming_birthdays = []
 
-        for user in self.data.values():
-            if user.birthday is not None:
-                # user.birthday.value is already a datetime.date object
-                birthday = user.birthday.value
-                birthday_this_year = datetime.date(today.year, birthday.month, birthday.day)
-                # 7 days including today is 6 days from today
-                if today <= birthday_this_year <= (today + datetime.timedelta(days=6)):
-                    congratulation_date = birthday_this_year
-                    if birthday_this_year.weekday() in (5, 6):
-                        congratulation_date = birthday_this_year + \
-                            datetime.timedelta(days = 7 - birthday_this_year.weekday())
-
-                    upcoming_birthdays.append(
-                        {
-                            'name': user.name.value,
-                            'congratulation_date': congratulation_date.strftime("%d.%m.%Y"),
-                        }
-                    )
+        # 7 days including today is 6 days from today
+        window = [today + datetime.timedelta(days=offset) for offset in range(7)]
+
+        for day in window:
+            for user in self._by_mmdd.get((day.month, day.day), ()):
+                congratulation_date = day
+                if day.weekday() in (5, 6):
+                    congratulation_date = day + datetime.timedelta(days=7 - day.weekday())
+
+                upcoming_birthdays.append(
+                    {
+                        'name': user.name.value,
+                        'congratulation_date': congratulation_date.strftime("%d.%m.%Y"),
+                    }
+                )
 
         return upcoming_birthdays
 
@@ -31,7 +31,7 @@ class TestAddressBook(unittest.TestCase):
         """
         msg = handler.add_contact(["Dmytro", "123-456-78-90"], self.book)
         contact = self.book.find("Dmytro")
-        self.assertEqual(contact.phones[1].value, "+381234567890")
+        self.assertEqual(list(contact.phones.values())[1].value, "+381234567890")
         self.assertEqual(msg, "Contact updated.")
 
     def test_add_contact_phone_existing_error(self):
@@ -47,7 +47,7 @@ class TestAddressBook(unittest.TestCase):
         """
         msg = handler.change_contact(["Dmytro", "096-123-46-57", "123-456-78-90"], self.book)
         contact = self.book.find("Dmytro")
-        self.assertEqual(contact.phones[0].value, "+381234567890")
+        self.assertEqual(list(contact.phones.values())[0].value, "+381234567890")
         self.assertEqual(msg, "Contact updated.")
 
     def test_delete_contact(self):
@@ -77,7 +77,7 @@ class TestAddressBook(unittest.TestCase):
         """
         handler.add_birthday(["Dmytro", "01.04.1990"], self.book)
         contact = handler.get_contact(["Dmytro"], self.book)
-        self.assertEqual(contact.birthday.value, datetime.datetime(1990, 4, 1))
+        self.assertEqual(contact.birthday.value, datetime.date(1990, 4, 1))
 
     def test_show_birthday(self):
         """
@@ -87,6 +87,19 @@ class TestAddressBook(unittest.TestCase):
         birthday = handler.show_birthday(["Dmytro"], self.book)
         self.assertEqual(birthday, "01.04.1990")
 
+    def test_from_records(self):
+        """
+        Test the AddressBook.from_records constructor by bulk-loading rows and checking the resulting book.
+        """
+        book = AddressBook.from_records([
+            ("John", "+380961234657", "01.04.1990"),
+            ("John", "123-456-78-90", None),
+            ("Jane", "096-123-46-58", None),
+        ])
+        self.assertEqual(len(book), 2)
+        self.assertEqual(len(book.find("John").phones), 2)
+        self.assertEqual(book.find("John").birthday.value, datetime.date(1990, 4, 1))
+
     def test_upcoming_birthdays(self):
         """
         Test the birthdays function by adding a birthday to a contact and checking if it is included in the upcoming birthdays list.